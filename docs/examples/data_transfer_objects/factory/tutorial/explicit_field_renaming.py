@@ -10,6 +10,8 @@ from litestar.dto.factory.stdlib.dataclass import DataclassDTO
 
 @dataclass
 class Address:
+    __slots__ = ("street", "city", "country")
+
     street: str
     city: str
     country: str
@@ -17,6 +19,8 @@ class Address:
 
 @dataclass
 class Person:
+    __slots__ = ("name", "age", "email", "address", "children")
+
     name: str
     age: int
     email: str
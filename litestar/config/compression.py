@@ -1,12 +1,24 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from enum import IntEnum
 from typing import Literal
 
 from litestar.exceptions import ImproperlyConfiguredException
 from litestar.middleware.compression import CompressionMiddleware
 
-__all__ = ("CompressionConfig",)
+__all__ = ("BrotliMode", "CompressionConfig")
+
+
+class BrotliMode(IntEnum):
+    """Brotli compression modes, the values mirror the ``brotli.MODE_*`` constants."""
+
+    GENERIC = 0
+    """Default compression mode, the compressor makes no assumptions about the input."""
+    TEXT = 1
+    """For UTF-8 format text input."""
+    FONT = 2
+    """For WOFF 2.0."""
 
 
 @dataclass
@@ -28,8 +40,12 @@ class CompressionConfig:
 
     The higher the quality, the slower the compression.
     """
-    brotli_mode: Literal["generic", "text", "font"] = "text"
-    """``MODE_GENERIC``, ``MODE_TEXT`` (for UTF-8 format text input, default) or ``MODE_FONT`` (for WOFF 2.0)."""
+    brotli_mode: BrotliMode | Literal["generic", "text", "font"] = BrotliMode.TEXT
+    """A :class:`BrotliMode`, defaults to ``BrotliMode.TEXT``.
+
+    The lowercase mode names ``"generic"``, ``"text"`` and ``"font"`` are also accepted, and converted to the
+    corresponding :class:`BrotliMode` member.
+    """
     brotli_lgwin: int = field(default=22)
     """Base 2 logarithm of size.
 
@@ -40,8 +56,19 @@ class CompressionConfig:
 
     Range is ``16`` to ``24``. If set to ``0``, the value will be set based on the quality. Defaults to ``0``.
     """
+    brotli_chunk_size: int = field(default=4096)
+    """Size (bytes) of the chunks fed to the Brotli compressor.
+
+    Must be a power of 2 between 1KB and 1MB. Defaults to 4KB.
+    """
     brotli_gzip_fallback: bool = True
     """Use GZIP if Brotli is not supported."""
+    skip_media_types: frozenset[str] = field(
+        default=frozenset(
+            {"image/jpeg", "image/png", "image/webp", "video/mp4", "application/zip", "application/octet-stream"}
+        )
+    )
+    """Media types of responses that are never compressed, as their content is already compressed."""
     middleware_class: type[CompressionMiddleware] = CompressionMiddleware
     """Middleware class to use, should be a subclass of :class:`CompressionMiddleware`."""
     exclude: str | list[str] | None = None
@@ -59,5 +86,27 @@ class CompressionConfig:
         if self.brotli_quality < 0 or self.brotli_quality > 11:
             raise ImproperlyConfiguredException("brotli_quality must be a value between 0 and 11")
 
+        if isinstance(self.brotli_mode, str):
+            try:
+                self.brotli_mode = BrotliMode[self.brotli_mode.upper()]
+            except KeyError as e:
+                raise ImproperlyConfiguredException(
+                    f"brotli_mode must be one of {', '.join(mode.name.lower() for mode in BrotliMode)}"
+                ) from e
+        elif isinstance(self.brotli_mode, bool):
+            raise ImproperlyConfiguredException("brotli_mode must be a BrotliMode")
+        else:
+            try:
+                self.brotli_mode = BrotliMode(self.brotli_mode)
+            except ValueError as e:
+                raise ImproperlyConfiguredException("brotli_mode must be a BrotliMode") from e
+
         if self.brotli_lgwin < 10 or self.brotli_lgwin > 24:
             raise ImproperlyConfiguredException("brotli_lgwin must be a value between 10 and 24")
+
+        if (
+            self.brotli_chunk_size < 1024
+            or self.brotli_chunk_size > 1024 * 1024
+            or self.brotli_chunk_size & (self.brotli_chunk_size - 1)
+        ):
+            raise ImproperlyConfiguredException("brotli_chunk_size must be a power of 2 between 1024 and 1048576")
@@ -1,17 +1,33 @@
 """Collection filter datastructures."""
 from __future__ import annotations
 
-from collections import abc  # noqa: TCH003
+import sys
 from dataclasses import dataclass
 from datetime import datetime  # noqa: TCH003
-from typing import Generic, Literal, TypeVar
+from typing import Any, Generic, Literal, TypeVar
+
+from typing_extensions import dataclass_transform
 
 T = TypeVar("T")
+C = TypeVar("C", bound=type)
 
 __all__ = ["BeforeAfter", "CollectionFilter", "LimitOffset", "OrderBy", "SearchFilter"]
 
+_DATACLASS_KWARGS: dict[str, Any] = {"frozen": True}
+if sys.version_info >= (3, 10):
+    _DATACLASS_KWARGS["slots"] = True
+
+
+@dataclass_transform(frozen_default=True)
+def _filter_dataclass(cls: C) -> C:
+    """Create a frozen dataclass, using ``__slots__`` where the running Python version supports it.
 
-@dataclass
+    Filter instances are created for every filtered request, so we avoid a per-instance ``__dict__``.
+    """
+    return dataclass(**_DATACLASS_KWARGS)(cls)  # type: ignore[return-value]
+
+
+@_filter_dataclass
 class BeforeAfter:
     """Data required to filter a query on a ``datetime`` column."""
 
@@ -23,17 +39,24 @@ class BeforeAfter:
     """Filter results where field later than this."""
 
 
-@dataclass
+# no slots: on a slotted frozen dataclass, the generated ``__setattr__`` refers to the class before it is rebuilt with
+# ``__slots__``, so ``typing`` setting ``__orig_class__`` on instances of e.g. ``CollectionFilter[int]`` raises
+# ``TypeError``.
+@dataclass(frozen=True)
 class CollectionFilter(Generic[T]):
     """Data required to construct a ``WHERE ... IN (...)`` clause."""
 
     field_name: str
     """Name of the model attribute to filter on."""
-    values: abc.Collection[T]
+    values: tuple[T, ...]
     """Values for ``IN`` clause."""
 
+    def __post_init__(self) -> None:
+        # accept any collection for backward compatibility, ``tuple()`` returns tuples as-is.
+        object.__setattr__(self, "values", tuple(self.values))
+
 
-@dataclass
+@_filter_dataclass
 class LimitOffset:
     """Data required to add limit/offset filtering to a query."""
 
@@ -43,7 +66,7 @@ class LimitOffset:
     """Value for ``OFFSET`` clause of query."""
 
 
-@dataclass
+@_filter_dataclass
 class OrderBy:
     """Data required to construct a ``ORDER BY ...`` clause."""
 
@@ -53,7 +76,7 @@ class OrderBy:
     """Sort ascending or descending"""
 
 
-@dataclass
+@_filter_dataclass
 class SearchFilter:
     """Data required to construct a ``WHERE field_name LIKE '%' || :value || '%'`` clause."""
 
@@ -19,7 +19,6 @@ from litestar.contrib.repository.filters import (
 )
 
 if TYPE_CHECKING:
-    from collections import abc
     from datetime import datetime
 
     from sqlalchemy.engine import Result
@@ -524,7 +523,7 @@ class SQLAlchemyAsyncRepository(AbstractAsyncRepository[ModelT], Generic[ModelT]
                 raise RepositoryError(f"Unexpected filter: {filter_}")
         return statement
 
-    def _filter_in_collection(self, field_name: str, values: abc.Collection[Any], statement: SelectT) -> SelectT:
+    def _filter_in_collection(self, field_name: str, values: tuple[Any, ...], statement: SelectT) -> SelectT:
         if not values:
             return statement
         return statement.where(getattr(self.model_type, field_name).in_(values))
@@ -1010,7 +1009,7 @@ class SQLAlchemySyncRepository(AbstractSyncRepository[ModelT], Generic[ModelT]):
                 raise RepositoryError(f"Unexpected filter: {filter_}")
         return statement
 
-    def _filter_in_collection(self, field_name: str, values: abc.Collection[Any], statement: SelectT) -> SelectT:
+    def _filter_in_collection(self, field_name: str, values: tuple[Any, ...], statement: SelectT) -> SelectT:
         if not values:
             return statement
         return statement.where(getattr(self.model_type, field_name).in_(values))
@@ -28,12 +28,13 @@ from .types import (
 from .utils import (
     RenameStrategies,
     build_annotation_for_backend,
+    build_exclude_trie,
+    create_transfer_data_fn,
     should_exclude_field,
-    transfer_data,
 )
 
 if TYPE_CHECKING:
-    from typing import AbstractSet, Any, Callable, Generator
+    from typing import Any, Callable, Generator
 
     from litestar.dto.factory import DTOConfig
     from litestar.dto.factory.types import FieldDefinition
@@ -42,7 +43,7 @@ if TYPE_CHECKING:
     from litestar.openapi.spec import Reference, Schema
     from litestar.types.serialization import LitestarEncodableType
 
-    from .types import FieldDefinitionsType
+    from .types import ExcludeTrie, FieldDefinitionsType
 
 __all__ = ("AbstractDTOBackend", "BackendContext")
 
@@ -106,6 +107,7 @@ class AbstractDTOBackend(ABC, Generic[BackendT]):
         "dto_data_type",
         "parsed_field_definitions",
         "reverse_name_map",
+        "transfer_data_fns",
         "transfer_model_type",
     )
 
@@ -116,7 +118,7 @@ class AbstractDTOBackend(ABC, Generic[BackendT]):
             context: context of the type represented by this backend.
         """
         self.context = context
-        self.parsed_field_definitions = self.parse_model(context.model_type, context.config.exclude)
+        self.parsed_field_definitions = self.parse_model(context.model_type, build_exclude_trie(context.config.exclude))
         self.transfer_model_type = self.create_transfer_model_type(
             get_fully_qualified_class_name(context.model_type), self.parsed_field_definitions
         )
@@ -127,11 +129,12 @@ class AbstractDTOBackend(ABC, Generic[BackendT]):
         else:
             annotation = context.parsed_type.annotation
         self.annotation = build_annotation_for_backend(annotation, self.transfer_model_type)
+        self.transfer_data_fns: dict[tuple[type[Any], ForType], Callable[[Any], Any]] = {}
 
     def parse_model(
         self,
         model_type: Any,
-        exclude: AbstractSet[str],
+        exclude: ExcludeTrie,
         nested_depth: int = 0,
     ) -> FieldDefinitionsType:
         """Reduce :attr:`model_type` to :class:`FieldDefinitionsType`.
@@ -244,9 +247,7 @@ class AbstractDTOBackend(ABC, Generic[BackendT]):
         if self.dto_data_type:
             return self.dto_data_type(
                 backend=self,
-                data_as_builtins=transfer_data(
-                    dict, self.parse_builtins(builtins, connection_context), self.parsed_field_definitions, "data"
-                ),
+                data_as_builtins=self._transfer_data(dict, self.parse_builtins(builtins, connection_context), "data"),
             )
         return self.transfer_data_from_builtins(self.parse_builtins(builtins, connection_context))
 
@@ -259,7 +260,7 @@ class AbstractDTOBackend(ABC, Generic[BackendT]):
         Returns:
             Instance or collection of ``model_type`` instances.
         """
-        return transfer_data(self.context.model_type, builtins, self.parsed_field_definitions, "data")
+        return self._transfer_data(self.context.model_type, builtins, "data")
 
     def populate_data_from_raw(self, raw: bytes, connection_context: ConnectionContext) -> Any:
         """Parse raw bytes into instance of `model_type`.
@@ -274,13 +275,9 @@ class AbstractDTOBackend(ABC, Generic[BackendT]):
         if self.dto_data_type:
             return self.dto_data_type(
                 backend=self,
-                data_as_builtins=transfer_data(
-                    dict, self.parse_raw(raw, connection_context), self.parsed_field_definitions, "data"
-                ),
+                data_as_builtins=self._transfer_data(dict, self.parse_raw(raw, connection_context), "data"),
             )
-        return transfer_data(
-            self.context.model_type, self.parse_raw(raw, connection_context), self.parsed_field_definitions, "data"
-        )
+        return self._transfer_data(self.context.model_type, self.parse_raw(raw, connection_context), "data")
 
     def encode_data(self, data: Any, connection_context: ConnectionContext) -> LitestarEncodableType:
         """Encode data into a ``LitestarEncodableType``.
@@ -292,9 +289,20 @@ class AbstractDTOBackend(ABC, Generic[BackendT]):
         Returns:
             Encoded data.
         """
-        return transfer_data(
-            self.transfer_model_type, data, self.parsed_field_definitions, "return"  # type: ignore[arg-type]
-        )
+        return self._transfer_data(self.transfer_model_type, data, "return")  # type: ignore[no-any-return]
+
+    def _transfer_data(self, destination_type: type[Any], source_data: Any, dto_for: ForType) -> Any:
+        """Transfer ``source_data`` into ``destination_type``, see :func:`transfer_data <.utils.transfer_data>`.
+
+        The transfer function is generated on first use for each ``destination_type`` and ``dto_for`` combination, and
+        reused for subsequent calls.
+        """
+        key = (destination_type, dto_for)
+        if (transfer_data_fn := self.transfer_data_fns.get(key)) is None:
+            transfer_data_fn = self.transfer_data_fns[key] = create_transfer_data_fn(
+                destination_type, self.parsed_field_definitions, dto_for
+            )
+        return transfer_data_fn(source_data)
 
     def create_openapi_schema(self, generate_examples: bool, schemas: dict[str, Schema]) -> Reference | Schema:
         """Create a RequestBody model for the given RouteHandler or return None."""
@@ -302,9 +310,9 @@ class AbstractDTOBackend(ABC, Generic[BackendT]):
         return create_schema(field=field, generate_examples=generate_examples, plugins=[], schemas=schemas)
 
     def _create_transfer_type(
-        self, parsed_type: ParsedType, exclude: AbstractSet[str], field_name: str, unique_name: str, nested_depth: int
+        self, parsed_type: ParsedType, exclude: ExcludeTrie, field_name: str, unique_name: str, nested_depth: int
     ) -> CompositeType | SimpleType:
-        exclude = _filter_exclude(exclude, field_name)
+        exclude = exclude.get(field_name, {})
 
         if parsed_type.is_union:
             return self._create_union_type(parsed_type, exclude, unique_name, nested_depth)
@@ -334,7 +342,7 @@ class AbstractDTOBackend(ABC, Generic[BackendT]):
         return SimpleType(parsed_type, nested_field_info=transfer_model)
 
     def _create_collection_type(
-        self, parsed_type: ParsedType, exclude: AbstractSet[str], unique_name: str, nested_depth: int
+        self, parsed_type: ParsedType, exclude: ExcludeTrie, unique_name: str, nested_depth: int
     ) -> CollectionType:
         inner_type = self._create_transfer_type(
             parsed_type=parsed_type.inner_types[0],
@@ -348,7 +356,7 @@ class AbstractDTOBackend(ABC, Generic[BackendT]):
         )
 
     def _create_mapping_type(
-        self, parsed_type: ParsedType, exclude: AbstractSet[str], unique_name: str, nested_depth: int
+        self, parsed_type: ParsedType, exclude: ExcludeTrie, unique_name: str, nested_depth: int
     ) -> MappingType:
         key_type = self._create_transfer_type(
             parsed_type=parsed_type.inner_types[0],
@@ -372,7 +380,7 @@ class AbstractDTOBackend(ABC, Generic[BackendT]):
         )
 
     def _create_tuple_type(
-        self, parsed_type: ParsedType, exclude: AbstractSet[str], unique_name: str, nested_depth: int
+        self, parsed_type: ParsedType, exclude: ExcludeTrie, unique_name: str, nested_depth: int
     ) -> TupleType:
         inner_types = tuple(
             self._create_transfer_type(
@@ -391,7 +399,7 @@ class AbstractDTOBackend(ABC, Generic[BackendT]):
         )
 
     def _create_union_type(
-        self, parsed_type: ParsedType, exclude: AbstractSet[str], unique_name: str, nested_depth: int
+        self, parsed_type: ParsedType, exclude: ExcludeTrie, unique_name: str, nested_depth: int
     ) -> UnionType:
         inner_types = tuple(
             self._create_transfer_type(
@@ -415,11 +423,6 @@ class AbstractDTOBackend(ABC, Generic[BackendT]):
         return f"{unique_name}-{secrets.token_hex(8)}"
 
 
-def _filter_exclude(exclude: AbstractSet[str], field_name: str) -> AbstractSet[str]:
-    """Filter exclude set to only include exclusions for the given field name."""
-    return {split[1] for s in exclude if (split := s.split(".", 1))[0] == field_name}
-
-
 def _enumerate_name(name: str, index: int) -> str:
     """Enumerate ``name`` with ``index``."""
     return f"{name}_{index}"
@@ -123,3 +123,10 @@ class TransferFieldDefinition(FieldDefinition):
 
 FieldDefinitionsType: TypeAlias = "tuple[TransferFieldDefinition, ...]"
 """Generic representation of names and types."""
+
+ExcludeTrie: TypeAlias = "dict[str, ExcludeTrie]"
+"""Dot-separated exclude paths, split into a tree of field names.
+
+A field name that maps to an empty ``dict`` is excluded. A field name that maps to a non-empty ``dict`` has nested
+fields excluded.
+"""
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import partial
+from keyword import iskeyword
 from typing import TYPE_CHECKING, Collection, Mapping, TypeVar, cast
 
 from msgspec import UNSET
@@ -19,16 +21,19 @@ from .types import (
 )
 
 if TYPE_CHECKING:
-    from typing import AbstractSet, Any, Iterable
+    from typing import AbstractSet, Any, Callable, Iterable
 
     from litestar.dto.factory.types import FieldDefinition, RenameStrategy
     from litestar.dto.types import ForType
 
-    from .types import FieldDefinitionsType
+    from .types import ExcludeTrie, FieldDefinitionsType
 
 __all__ = (
     "RenameStrategies",
     "build_annotation_for_backend",
+    "build_exclude_trie",
+    "create_transfer_data_fn",
+    "create_transfer_instance_data_fn",
     "create_transfer_model_type_annotation",
     "should_exclude_field",
     "transfer_data",
@@ -56,12 +61,40 @@ def build_annotation_for_backend(annotation: Any, model: type[T]) -> type[T] | t
         return annotation.copy_with((model,))  # type:ignore[no-any-return]
 
 
-def should_exclude_field(field_definition: FieldDefinition, exclude: AbstractSet[str], dto_for: ForType) -> bool:
+def build_exclude_trie(exclude: AbstractSet[str]) -> ExcludeTrie:
+    """Split dot-separated exclude paths into a tree of field names.
+
+    For example, ``{"a", "b.c", "b.d.0.e"}`` becomes ``{"a": {}, "b": {"c": {}, "d": {"0": {"e": {}}}}}``.
+
+    Args:
+        exclude: dot-separated paths of fields to exclude.
+
+    Returns:
+        The exclude paths as an :data:`ExcludeTrie <.types.ExcludeTrie>`.
+    """
+    trie: ExcludeTrie = {}
+    # shorter paths first, so that an excluded field swallows any exclusions nested below it
+    for path in sorted(exclude, key=lambda p: p.count(".")):
+        *parents, name = path.split(".")
+        node = trie
+        for parent in parents:
+            child = node.get(parent)
+            if child is None:
+                child = node[parent] = {}
+            elif not child:
+                break
+            node = child
+        else:
+            node[name] = {}
+    return trie
+
+
+def should_exclude_field(field_definition: FieldDefinition, exclude: ExcludeTrie, dto_for: ForType) -> bool:
     """Returns ``True`` where a field should be excluded from data transfer.
 
     Args:
         field_definition: defined DTO field
-        exclude: names of fields to exclude
+        exclude: fields to exclude, see :func:`build_exclude_trie`.
         dto_for: indicates whether the DTO is for the request body or response.
 
     Returns:
@@ -69,7 +102,7 @@ def should_exclude_field(field_definition: FieldDefinition, exclude: AbstractSet
     """
     field_name = field_definition.name
     dto_field = field_definition.dto_field
-    excluded = field_name in exclude
+    excluded = exclude.get(field_name) == {}
     private = dto_field and dto_field.mark is Mark.PRIVATE
     read_only_for_write = dto_for == "data" and dto_field and dto_field.mark is Mark.READ_ONLY
     return bool(excluded or private or read_only_for_write)
@@ -223,6 +256,117 @@ def transfer_nested_union_type_data(transfer_type: UnionType, dto_for: ForType,
     return source_value
 
 
+def create_transfer_data_fn(
+    destination_type: type[T], field_definitions: FieldDefinitionsType, dto_for: ForType
+) -> Callable[[Any], T | Collection[T]]:
+    """Create a function that behaves like :func:`transfer_data`, specialized for the given arguments.
+
+    Args:
+        destination_type: the model type received by the DTO on type narrowing.
+        field_definitions: model field definitions.
+        dto_for: indicates whether the DTO is for the request body or response.
+
+    Returns:
+        A function that receives ``source_data`` and returns an instance or iterable of instances of
+        ``destination_type``.
+    """
+    transfer_instance = create_transfer_instance_data_fn(destination_type, field_definitions, dto_for)
+
+    def _transfer_data(source_data: Any) -> T | Collection[T]:
+        if not isinstance(source_data, Mapping) and isinstance(source_data, Collection):
+            return type(source_data)(_transfer_data(item) for item in source_data)  # type:ignore[call-arg]
+        return transfer_instance(source_data)
+
+    return _transfer_data
+
+
+def create_transfer_instance_data_fn(
+    destination_type: type[T], field_definitions: FieldDefinitionsType, dto_for: ForType
+) -> Callable[[Any], T]:
+    """Generate a function that behaves like :func:`transfer_instance_data`, specialized for the given arguments.
+
+    The function is compiled from straight-line source code, so that transferring an instance does not require
+    iterating over the field definitions, or inspecting their transfer types.
+
+    Args:
+        destination_type: the model type received by the DTO on type narrowing.
+        field_definitions: model field definitions.
+        dto_for: indicates whether the DTO is for the request body or response.
+
+    Returns:
+        A function that receives ``source_instance`` and returns an instance of ``destination_type``.
+    """
+    namespace: dict[str, Any] = {
+        "Mapping": Mapping,
+        "UNSET": UNSET,
+        "destination_type": destination_type,
+        "transfer_mapping": lambda source_instance: transfer_instance_data(
+            destination_type, source_instance, field_definitions, dto_for
+        ),
+    }
+    required_items: list[str] = []
+    partial_lines: list[str] = []
+
+    for i, field_definition in enumerate(field_definitions):
+        source_name = field_definition.serialization_name if dto_for == "data" else field_definition.name
+        destination_name = field_definition.name if dto_for == "data" else field_definition.serialization_name
+        source_value = (
+            f"source_instance.{source_name}"
+            if source_name.isidentifier() and not iskeyword(source_name)
+            else f"getattr(source_instance, {source_name!r})"
+        )
+        skip_unset = field_definition.is_partial and dto_for == "data"
+        value = f"value_{i}" if skip_unset else source_value
+
+        if transfer_fn := _create_transfer_type_data_fn(field_definition.transfer_type, dto_for):
+            namespace[f"transfer_{i}"] = transfer_fn
+            transferred_value = f"transfer_{i}({value})"
+        else:
+            transferred_value = value
+
+        if skip_unset:
+            partial_lines.extend(
+                (
+                    f"    {value} = {source_value}",
+                    f"    if {value} is not UNSET:",
+                    f"        unstructured_data[{destination_name!r}] = {transferred_value}",
+                )
+            )
+        else:
+            required_items.append(f"{destination_name!r}: {transferred_value}")
+
+    source = "\n".join(
+        (
+            "def transfer_instance_data(source_instance):",
+            "    if isinstance(source_instance, Mapping):",
+            "        return transfer_mapping(source_instance)",
+            f"    unstructured_data = {{{', '.join(required_items)}}}",
+            *partial_lines,
+            "    return destination_type(**unstructured_data)",
+        )
+    )
+    exec(compile(source, f"<dto transfer {destination_type!r}>", "exec"), namespace)  # noqa: S102
+    return cast("Callable[[Any], T]", namespace["transfer_instance_data"])
+
+
+def _create_transfer_type_data_fn(transfer_type: TransferType, dto_for: ForType) -> Callable[[Any], Any] | None:
+    """Create a function that behaves like :func:`transfer_type_data`, specialized for the given arguments.
+
+    Returns:
+        ``None`` if values of ``transfer_type`` are transferred as-is.
+    """
+    if isinstance(transfer_type, SimpleType) and transfer_type.nested_field_info:
+        dest_type = transfer_type.parsed_type.annotation if dto_for == "data" else transfer_type.nested_field_info.model
+        return create_transfer_instance_data_fn(dest_type, transfer_type.nested_field_info.field_definitions, dto_for)
+    if isinstance(transfer_type, UnionType) and transfer_type.has_nested:
+        return partial(transfer_nested_union_type_data, transfer_type, dto_for)
+    if isinstance(transfer_type, CollectionType) and transfer_type.has_nested:
+        origin_type = transfer_type.parsed_type.origin
+        transfer_item = _create_transfer_type_data_fn(transfer_type.inner_type, dto_for) or (lambda item: item)
+        return lambda source_value: origin_type(transfer_item(item) for item in source_value)
+    return None
+
+
 def create_transfer_model_type_annotation(transfer_type: TransferType) -> Any:
     """Create a type annotation for a transfer model.
 
@@ -12,7 +12,7 @@ from ._backends.abc import BackendContext
 from .config import DTOConfig
 from .data_structures import DTOData
 from .exc import InvalidAnnotation
-from .utils import parse_configs_from_annotation
+from .utils import get_model_type_hints, parse_configs_from_annotation
 
 if TYPE_CHECKING:
     from typing import Any, ClassVar, Collection, Generator
@@ -44,6 +44,7 @@ class AbstractDTOFactory(DTOInterface, Generic[DataT], metaclass=ABCMeta):
 
     _type_backend_map: ClassVar[dict[tuple[ForType, ParsedType, RequestEncodingType | str | None], AbstractDTOBackend]]
     _handler_backend_map: ClassVar[dict[tuple[ForType, str], AbstractDTOBackend]]
+    _model_type_hints: ClassVar[dict[type[Any], dict[str, ParsedType]]]
 
     def __init__(self, connection_context: ConnectionContext) -> None:
         """Create an AbstractDTOFactory type.
@@ -82,7 +83,12 @@ class AbstractDTOFactory(DTOInterface, Generic[DataT], metaclass=ABCMeta):
             # otherwise, create a new config
             config = DTOConfig()
 
-        cls_dict: dict[str, Any] = {"config": config, "_type_backend_map": {}, "_handler_backend_map": {}}
+        cls_dict: dict[str, Any] = {
+            "config": config,
+            "_type_backend_map": {},
+            "_handler_backend_map": {},
+            "_model_type_hints": {},
+        }
         if not parsed_type.is_type_var:
             cls_dict.update(model_type=parsed_type.annotation)
 
@@ -102,6 +108,27 @@ class AbstractDTOFactory(DTOInterface, Generic[DataT], metaclass=ABCMeta):
         backend = self._get_backend("return", self.connection_context.handler_id)
         return backend.encode_data(data, self.connection_context)
 
+    @classmethod
+    def _get_cached_model_type_hints(cls, model_type: type[Any]) -> dict[str, ParsedType]:
+        """Retrieve type annotations for ``model_type``.
+
+        Type hints are resolved once per model type, and stored on the DTO type for subsequent calls, so that forward
+        references, such as self-referencing nested models, are not evaluated again for every field definition. DTO
+        types that have not been narrowed to a model type have no cache, and resolve the type hints on every call.
+
+        Args:
+            model_type: Any type-annotated class.
+
+        Returns:
+            Parsed type hints for ``model_type`` resolved within the scope of its module.
+        """
+        cache: dict[type[Any], dict[str, ParsedType]] | None = getattr(cls, "_model_type_hints", None)
+        if cache is None:
+            return get_model_type_hints(model_type)
+        if model_type not in cache:
+            cache[model_type] = get_model_type_hints(model_type)
+        return cache[model_type]
+
     @classmethod
     @abstractmethod
     def generate_field_definitions(cls, model_type: type[Any]) -> Generator[FieldDefinition, None, None]:
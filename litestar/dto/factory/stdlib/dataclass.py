@@ -6,7 +6,6 @@ from typing import TYPE_CHECKING, Generic, TypeVar
 from litestar.dto.factory.abc import AbstractDTOFactory
 from litestar.dto.factory.field import DTO_FIELD_META_KEY
 from litestar.dto.factory.types import FieldDefinition
-from litestar.dto.factory.utils import get_model_type_hints
 from litestar.types.empty import Empty
 from litestar.utils.helpers import get_fully_qualified_class_name
 
@@ -32,7 +31,7 @@ class DataclassDTO(AbstractDTOFactory[DataT], Generic[DataT]):
     @classmethod
     def generate_field_definitions(cls, model_type: type[DataclassProtocol]) -> Generator[FieldDefinition, None, None]:
         dc_fields = {f.name: f for f in fields(model_type)}
-        for key, parsed_type in get_model_type_hints(model_type).items():
+        for key, parsed_type in cls._get_cached_model_type_hints(model_type).items():
             if not (dc_field := dc_fields.get(key)):
                 continue
 
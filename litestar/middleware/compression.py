@@ -34,20 +34,29 @@ if TYPE_CHECKING:
 class CompressionFacade:
     """A unified facade offering a uniform interface for different compression libraries."""
 
-    __slots__ = ("compressor", "buffer", "compression_encoding")
+    __slots__ = ("compressor", "buffer", "compression_encoding", "chunk_size")
 
     compressor: GzipFile | Compressor  # pyright: ignore
 
-    def __init__(self, buffer: BytesIO, compression_encoding: CompressionEncoding, config: CompressionConfig) -> None:
+    def __init__(
+        self,
+        buffer: BytesIO,
+        compression_encoding: CompressionEncoding,
+        config: CompressionConfig,
+        content_length: int | None = None,
+    ) -> None:
         """Initialize ``CompressionFacade``.
 
         Args:
             buffer: A bytes IO buffer to write the compressed data into.
             compression_encoding: The compression encoding used.
             config: The app compression config.
+            content_length: The total size of the content to compress, if known. Used to shrink the Brotli window to
+                the size of the content.
         """
         self.buffer = buffer
         self.compression_encoding = compression_encoding
+        self.chunk_size = config.brotli_chunk_size
 
         if compression_encoding == CompressionEncoding.BROTLI:
             try:
@@ -55,17 +64,18 @@ class CompressionFacade:
             except ImportError as e:
                 raise MissingDependencyException("brotli") from e
 
-            from brotli import MODE_FONT, MODE_GENERIC, MODE_TEXT, Compressor
+            from brotli import Compressor
+
+            lgwin = config.brotli_lgwin
+            if content_length:
+                # a window larger than the content does not improve the compression ratio, but costs memory. The window
+                # holds ``(1 << lgwin) - 16`` bytes, so this is the smallest window that fits the whole content.
+                lgwin = min(lgwin, max(10, (content_length + 15).bit_length()))
 
-            modes: dict[Literal["generic", "text", "font"], int] = {
-                "text": int(MODE_TEXT),
-                "font": int(MODE_FONT),
-                "generic": int(MODE_GENERIC),
-            }
             self.compressor = Compressor(
                 quality=config.brotli_quality,
-                mode=modes[config.brotli_mode],
-                lgwin=config.brotli_lgwin,
+                mode=int(config.brotli_mode),
+                lgwin=lgwin,
                 lgblock=config.brotli_lgblock,
             )
         else:
@@ -82,7 +92,13 @@ class CompressionFacade:
         """
 
         if self.compression_encoding == CompressionEncoding.BROTLI:
-            self.buffer.write(self.compressor.process(body) + self.compressor.flush())  # type: ignore
+            if len(body) <= self.chunk_size:
+                self.buffer.write(self.compressor.process(body))  # type: ignore
+            else:
+                view = memoryview(body)
+                for offset in range(0, len(view), self.chunk_size):
+                    self.buffer.write(self.compressor.process(view[offset : offset + self.chunk_size]))  # type: ignore
+            self.buffer.write(self.compressor.flush())  # type: ignore
         else:
             self.compressor.write(body)
 
@@ -116,6 +132,20 @@ class CompressionMiddleware(AbstractMiddleware):
         )
         self.config = config
 
+    def _is_skipped_media_type(self, message: HTTPResponseStartEvent) -> bool:
+        """Check if the response media type is one that should not be compressed.
+
+        Args:
+            message: An ASGI ``http.response.start`` message.
+
+        Returns:
+            ``True`` if the ``Content-Type`` of the response is in ``skip_media_types``.
+        """
+        if not self.config.skip_media_types:
+            return False
+        content_type = MutableScopeHeaders(message).get("Content-Type", "")
+        return content_type.split(";", 1)[0].strip().lower() in self.config.skip_media_types
+
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """ASGI callable.
 
@@ -171,11 +201,23 @@ class CompressionMiddleware(AbstractMiddleware):
         """
 
         buffer = BytesIO()
-        facade = CompressionFacade(buffer=buffer, compression_encoding=compression_encoding, config=self.config)
+        # the compressor is only created once we know the response will be compressed, so that small responses never
+        # pay for the encoder initialization.
+        facade = Ref[Optional[CompressionFacade]](None)
 
         initial_message = Ref[Optional["HTTPResponseStartEvent"]](None)
         started = Ref[bool](False)
 
+        def get_facade(content_length: int | None = None) -> CompressionFacade:
+            if facade.value is None:
+                facade.value = CompressionFacade(
+                    buffer=buffer,
+                    compression_encoding=compression_encoding,
+                    config=self.config,
+                    content_length=content_length,
+                )
+            return facade.value
+
         async def send_wrapper(message: Message) -> None:
             """Handle and compresses the HTTP Message with brotli.
 
@@ -184,6 +226,11 @@ class CompressionMiddleware(AbstractMiddleware):
             """
 
             if message["type"] == "http.response.start":
+                if self._is_skipped_media_type(message):
+                    # already compressed content, e.g. images, would not get any smaller. The response messages are
+                    # sent as-is, as ``initial_message`` is never set.
+                    await send(message)
+                    return
                 initial_message.value = message
                 return
 
@@ -195,12 +242,14 @@ class CompressionMiddleware(AbstractMiddleware):
                     started.value = True
                     if more_body:
                         headers = MutableScopeHeaders(initial_message.value)
+                        content_length = headers.get("Content-Length")
                         headers["Content-Encoding"] = compression_encoding
                         headers.extend_header_value("vary", "Accept-Encoding")
                         del headers["Content-Length"]
                         set_litestar_scope_state(scope, SCOPE_STATE_RESPONSE_COMPRESSED, True)
 
-                        facade.write(body)
+                        compressor = get_facade(int(content_length) if content_length else None)
+                        compressor.write(body)
 
                         message["body"] = buffer.getvalue()
                         buffer.seek(0)
@@ -209,8 +258,9 @@ class CompressionMiddleware(AbstractMiddleware):
                         await send(message)
 
                     elif len(body) >= self.config.minimum_size:
-                        facade.write(body)
-                        facade.close()
+                        compressor = get_facade(len(body))
+                        compressor.write(body)
+                        compressor.close()
                         body = buffer.getvalue()
 
                         headers = MutableScopeHeaders(initial_message.value)
@@ -228,9 +278,10 @@ class CompressionMiddleware(AbstractMiddleware):
                         await send(message)
 
                 else:
-                    facade.write(body)
+                    compressor = get_facade()
+                    compressor.write(body)
                     if not more_body:
-                        facade.close()
+                        compressor.close()
 
                     message["body"] = buffer.getvalue()
 
@@ -242,4 +293,7 @@ class CompressionMiddleware(AbstractMiddleware):
 
                     await send(message)
 
+            else:
+                await send(message)
+
         return send_wrapper
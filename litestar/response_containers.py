@@ -273,6 +273,11 @@ class Stream(ResponseContainer[StreamingResponse]):
     """If defined, overrides the media type configured in the route decorator."""
     encoding: str = field(default="utf-8")
     """The encoding to be used for the response headers."""
+    content_length: int | None = field(default=None)
+    """The total size (bytes) of the streamed content, if known in advance.
+
+    If set, it is sent as the ``Content-Length`` header and allows the compression middleware to size its encoder.
+    """
 
     def __post_init__(self) -> None:
         """Set the iterator value by ensuring that the return value is iterable.
@@ -311,6 +316,8 @@ class Stream(ResponseContainer[StreamingResponse]):
         Returns:
             A :class:`StreamingResponse <.response.StreamingResponse>` instance
         """
+        if self.content_length is not None:
+            headers = {**headers, "content-length": str(self.content_length)}
 
         return StreamingResponse(
             background=self.background,
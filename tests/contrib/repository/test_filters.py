@@ -0,0 +1,56 @@
+import pickle
+import sys
+from dataclasses import FrozenInstanceError, fields, replace
+from datetime import datetime
+from typing import Any
+
+import pytest
+
+from litestar.contrib.repository.filters import BeforeAfter, CollectionFilter, LimitOffset, OrderBy, SearchFilter
+
+SLOTTED_FILTERS = (
+    BeforeAfter("created", datetime.min, datetime.max),
+    LimitOffset(10, 20),
+    OrderBy("name", "desc"),
+    SearchFilter("name", "litestar", ignore_case=True),
+)
+FILTERS = (
+    *SLOTTED_FILTERS,
+    CollectionFilter("id", (1, 2, 3)),
+    CollectionFilter[int]("id", (1, 2, 3)),
+)
+
+
+@pytest.mark.parametrize("filter_", FILTERS)
+def test_filters_are_frozen(filter_: Any) -> None:
+    with pytest.raises(FrozenInstanceError):
+        setattr(filter_, fields(filter_)[0].name, None)
+
+
+@pytest.mark.parametrize("filter_", SLOTTED_FILTERS)
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots require python 3.10")
+def test_filters_are_slotted(filter_: Any) -> None:
+    assert not hasattr(filter_, "__dict__")
+
+
+@pytest.mark.parametrize("filter_", FILTERS)
+def test_filters_pickle_round_trip(filter_: Any) -> None:
+    assert pickle.loads(pickle.dumps(filter_)) == filter_
+
+
+def test_filters_replace() -> None:
+    assert replace(LimitOffset(10, 20), offset=30) == LimitOffset(10, 30)
+
+
+@pytest.mark.parametrize("filter_", FILTERS)
+def test_filters_replace_without_changes(filter_: Any) -> None:
+    assert replace(filter_) == filter_
+
+
+@pytest.mark.parametrize("values", ([1, 2, 3], {1, 2, 3}, (1, 2, 3), range(1, 4)))
+def test_collection_filter_values_coerced_to_tuple(values: Any) -> None:
+    assert CollectionFilter("id", values).values == (1, 2, 3)
+
+
+def test_subscripted_collection_filter() -> None:
+    assert CollectionFilter[int]("id", [1]).values == (1,)
@@ -394,7 +394,7 @@ def test_sqlalchemy_repo_list_with_collection_filter(
     execute_mock = MagicMock(return_value=result_mock)
     monkeypatch.setattr(mock_repo, "_execute", execute_mock)
     mock_repo.statement.where.return_value = mock_repo.statement
-    values = [1, 2, 3]
+    values = (1, 2, 3)
     mock_repo.list(CollectionFilter(field_name, values))
     mock_repo.statement.where.assert_called_once()
     getattr(mock_repo.model_type, field_name).in_.assert_called_once_with(values)
@@ -453,7 +453,7 @@ def testexecute(mock_repo: SQLAlchemySyncRepository) -> None:
 
 def test_filter_in_collection_noop_if_collection_empty(mock_repo: SQLAlchemySyncRepository) -> None:
     """Ensures we don't filter on an empty collection."""
-    mock_repo._filter_in_collection("id", [], statement=mock_repo.statement)
+    mock_repo._filter_in_collection("id", (), statement=mock_repo.statement)
     mock_repo.statement.where.assert_not_called()
 
 
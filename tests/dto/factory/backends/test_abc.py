@@ -20,9 +20,7 @@ from litestar.types.empty import Empty
 from litestar.typing import ParsedType
 
 if TYPE_CHECKING:
-    from typing import AbstractSet
-
-    from litestar.dto.factory._backends.types import FieldDefinitionsType, TransferType
+    from litestar.dto.factory._backends.types import ExcludeTrie, FieldDefinitionsType, TransferType
     from litestar.dto.interface import ConnectionContext
 
 
@@ -125,12 +123,12 @@ def fx_backend(context: BackendContext) -> AbstractDTOBackend:
 def create_transfer_type(
     backend: AbstractDTOBackend,
     parsed_type: ParsedType,
-    exclude: AbstractSet[str] | None = None,
+    exclude: ExcludeTrie | None = None,
     field_name: str = "name",
     unique_name: str = "some_module.SomeModel.name",
     nested_depth: int = 0,
 ) -> TransferType:
-    return backend._create_transfer_type(parsed_type, exclude or set(), field_name, unique_name, nested_depth)
+    return backend._create_transfer_type(parsed_type, exclude or {}, field_name, unique_name, nested_depth)
 
 
 @pytest.mark.parametrize(
@@ -13,6 +13,7 @@ from litestar.dto.factory import DTOConfig
 from litestar.dto.factory._backends import MsgspecDTOBackend, PydanticDTOBackend
 from litestar.dto.factory._backends.abc import BackendContext
 from litestar.dto.factory._backends.types import CollectionType, SimpleType, TransferFieldDefinition
+from litestar.dto.factory._backends.utils import create_transfer_data_fn, transfer_data
 from litestar.dto.factory.stdlib.dataclass import DataclassDTO
 from litestar.dto.interface import ConnectionContext
 from litestar.enums import MediaType
@@ -26,6 +27,7 @@ if TYPE_CHECKING:
     from typing import Any
 
     from litestar.dto.factory._backends import AbstractDTOBackend
+    from litestar.dto.types import ForType
 
 
 @dataclass
@@ -298,3 +300,36 @@ dto_type = DataclassDTO[Model]
     assert b_d_nested_info is not None
     assert not any(f.name == "e" for f in b_d_nested_info.field_definitions)
     assert b_d_nested_info.field_definitions[0].name == "f"
+
+
+@pytest.mark.parametrize(
+    "config, raw",
+    [
+        (DTOConfig(), RAW),
+        (
+            DTOConfig(rename_fields={"a": "class"}, exclude={"b", "optional"}),
+            b'{"class":1,"nested":{"class":1,"b":"two"},"nested_list":[{"class":1,"b":"two"}],"c":[]}',
+        ),
+    ],
+)
+@pytest.mark.parametrize("dto_for", ["data", "return"])
+def test_create_transfer_data_fn_matches_transfer_data(
+    config: DTOConfig, raw: bytes, dto_for: ForType, connection_context: ConnectionContext
+) -> None:
+    ctx = BackendContext(
+        config, dto_for, ParsedType(DC), DataclassDTO.generate_field_definitions, DataclassDTO.detect_nested_field, DC
+    )
+    backend = MsgspecDTOBackend(ctx)
+    destination_type: Any
+    if dto_for == "data":
+        destination_type = DC
+        source = backend.parse_raw(raw, connection_context)
+    else:
+        destination_type = backend.transfer_model_type
+        source = STRUCTURED
+
+    transfer = create_transfer_data_fn(destination_type, backend.parsed_field_definitions, dto_for)
+    for source_data in (source, [source, source], (source,)):
+        assert transfer(source_data) == transfer_data(
+            destination_type, source_data, backend.parsed_field_definitions, dto_for
+        )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Tuple, Union
+from typing import Any, Dict, List, Tuple, Union
 
 import pytest
 from msgspec import Struct
@@ -15,7 +15,11 @@ from litestar.dto.factory._backends.types import (
     TupleType,
     UnionType,
 )
-from litestar.dto.factory._backends.utils import create_transfer_model_type_annotation, transfer_nested_union_type_data
+from litestar.dto.factory._backends.utils import (
+    build_exclude_trie,
+    create_transfer_model_type_annotation,
+    transfer_nested_union_type_data,
+)
 from litestar.typing import ParsedType
 
 
@@ -146,3 +150,17 @@ def test_create_transfer_model_type_annotation_unexpected_transfer_type() -> Non
     transfer_type = CompositeType(parsed_type=ParsedType(Union[str, int]), has_nested=False)
     with pytest.raises(RuntimeError):
         create_transfer_model_type_annotation(transfer_type=transfer_type)
+
+
+@pytest.mark.parametrize(
+    "exclude, expected",
+    [
+        (set(), {}),
+        ({"a", "b.c", "b.d.0.e"}, {"a": {}, "b": {"c": {}, "d": {"0": {"e": {}}}}}),
+        ({"a", "a.b", "a.b.c"}, {"a": {}}),
+        ({"a.b.c", "a.b"}, {"a": {"b": {}}}),
+        ({"children.0"}, {"children": {"0": {}}}),
+    ],
+)
+def test_build_exclude_trie(exclude: set[str], expected: dict[str, Any]) -> None:
+    assert build_exclude_trie(exclude) == expected
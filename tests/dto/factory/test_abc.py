@@ -113,6 +113,23 @@ async def test_from_bytes(request_factory: RequestFactory) -> None:
     assert dto_type(conn_ctx).bytes_to_data_type(b'{"a":1,"b":"two"}') == Model(a=1, b="two")
 
 
+def test_model_type_hints_resolved_once() -> None:
+    dto_type = DataclassDTO[Model]
+    with patch("litestar.dto.factory.abc.get_model_type_hints", return_value={}) as get_model_type_hints_mock:
+        list(dto_type.generate_field_definitions(Model))
+        list(dto_type.generate_field_definitions(Model))
+    get_model_type_hints_mock.assert_called_once_with(Model)
+    assert dto_type._model_type_hints == {Model: {}}
+
+
+def test_model_type_hints_not_cached_without_type_narrowing() -> None:
+    with patch("litestar.dto.factory.abc.get_model_type_hints", return_value={}) as get_model_type_hints_mock:
+        list(DataclassDTO.generate_field_definitions(Model))
+        list(DataclassDTO.generate_field_definitions(Model))
+    assert get_model_type_hints_mock.call_count == 2
+    assert not hasattr(DataclassDTO, "_model_type_hints")
+
+
 def test_config_field_rename() -> None:
     config = DTOConfig(rename_fields={"a": "z"})
     dto_type = DataclassDTO[Annotated[Model, config]]
@@ -0,0 +1,85 @@
+from typing import Any, Optional
+
+import pytest
+
+from litestar.config.compression import BrotliMode, CompressionConfig
+from litestar.exceptions import ImproperlyConfiguredException
+
+
+@pytest.mark.parametrize("minimum_size, should_raise", ((0, True), (1, False), (-1, True), (100, False)))
+def test_config_minimum_size_validation(minimum_size: int, should_raise: bool) -> None:
+    if should_raise:
+        with pytest.raises(ImproperlyConfiguredException):
+            CompressionConfig(backend="brotli", brotli_gzip_fallback=False, minimum_size=minimum_size)
+    else:
+        CompressionConfig(backend="brotli", brotli_gzip_fallback=False, minimum_size=minimum_size)
+
+
+@pytest.mark.parametrize(
+    "gzip_compress_level, should_raise", ((0, False), (1, False), (-1, True), (10, True), (9, False))
+)
+def test_config_gzip_compress_level_validation(gzip_compress_level: int, should_raise: bool) -> None:
+    if should_raise:
+        with pytest.raises(ImproperlyConfiguredException):
+            CompressionConfig(backend="brotli", brotli_gzip_fallback=False, gzip_compress_level=gzip_compress_level)
+    else:
+        CompressionConfig(backend="brotli", brotli_gzip_fallback=False, gzip_compress_level=gzip_compress_level)
+
+
+@pytest.mark.parametrize("brotli_quality, should_raise", ((0, False), (1, False), (-1, True), (12, True), (11, False)))
+def test_config_brotli_quality_validation(brotli_quality: int, should_raise: bool) -> None:
+    if should_raise:
+        with pytest.raises(ImproperlyConfiguredException):
+            CompressionConfig(backend="brotli", brotli_gzip_fallback=False, brotli_quality=brotli_quality)
+    else:
+        CompressionConfig(backend="brotli", brotli_gzip_fallback=False, brotli_quality=brotli_quality)
+
+
+@pytest.mark.parametrize("brotli_lgwin, should_raise", ((9, True), (10, False), (-1, True), (25, True), (24, False)))
+def test_config_brotli_lgwin_validation(brotli_lgwin: int, should_raise: bool) -> None:
+    if should_raise:
+        with pytest.raises(ImproperlyConfiguredException):
+            CompressionConfig(backend="brotli", brotli_gzip_fallback=False, brotli_lgwin=brotli_lgwin)
+    else:
+        CompressionConfig(backend="brotli", brotli_gzip_fallback=False, brotli_lgwin=brotli_lgwin)
+
+
+@pytest.mark.parametrize(
+    "brotli_mode, expected",
+    (
+        ("text", BrotliMode.TEXT),
+        ("generic", BrotliMode.GENERIC),
+        ("font", BrotliMode.FONT),
+        (BrotliMode.TEXT, BrotliMode.TEXT),
+        (BrotliMode.FONT, BrotliMode.FONT),
+        (1, BrotliMode.TEXT),
+        (True, None),
+        ("binary", None),
+        (3, None),
+    ),
+)
+def test_config_brotli_mode_validation(brotli_mode: Any, expected: Optional[BrotliMode]) -> None:
+    if expected is None:
+        with pytest.raises(ImproperlyConfiguredException):
+            CompressionConfig(backend="brotli", brotli_gzip_fallback=False, brotli_mode=brotli_mode)
+    else:
+        config = CompressionConfig(backend="brotli", brotli_gzip_fallback=False, brotli_mode=brotli_mode)
+        assert config.brotli_mode is expected
+
+
+@pytest.mark.parametrize(
+    "brotli_chunk_size, should_raise",
+    ((512, True), (1024, False), (4096, False), (5000, True), (1024 * 1024, False), (2 * 1024 * 1024, True)),
+)
+def test_config_brotli_chunk_size_validation(brotli_chunk_size: int, should_raise: bool) -> None:
+    if should_raise:
+        with pytest.raises(ImproperlyConfiguredException):
+            CompressionConfig(backend="brotli", brotli_gzip_fallback=False, brotli_chunk_size=brotli_chunk_size)
+    else:
+        CompressionConfig(backend="brotli", brotli_gzip_fallback=False, brotli_chunk_size=brotli_chunk_size)
+
+
+def test_config_skip_media_types() -> None:
+    assert "image/png" in CompressionConfig(backend="gzip").skip_media_types
+    config = CompressionConfig(backend="gzip", skip_media_types=frozenset({"image/jpeg"}))
+    assert config.skip_media_types == frozenset({"image/jpeg"})
@@ -1,104 +1,189 @@
-from typing import AsyncIterator, Literal
+from io import BytesIO
+from typing import TYPE_CHECKING, AsyncIterator, Iterator, List, Optional
 
 import pytest
+from pytest_lazyfixture import lazy_fixture
+from pytest_mock import MockerFixture
 
 from litestar import MediaType, WebSocket, get, websocket
 from litestar.config.compression import CompressionConfig
 from litestar.enums import CompressionEncoding
-from litestar.exceptions import ImproperlyConfiguredException
 from litestar.handlers import HTTPRouteHandler
+from litestar.middleware.compression import CompressionFacade
 from litestar.response_containers import Stream
 from litestar.status_codes import HTTP_200_OK
 from litestar.testing import create_test_client
 
-BrotliMode = Literal["text", "generic", "font"]
+if TYPE_CHECKING:
+    from litestar import Litestar
+    from litestar.testing import TestClient
+
+_PAYLOAD = "_litestar_" * 4000
+_PAYLOAD_BYTES = b"_litestar_" * 4000
+_SMALL_PAYLOAD = "_litestar_"
+_STREAM_CHUNKS = [b"_litestar_" * 1334, b"_litestar_" * 1333, b"_litestar_" * 1333]
+_ENC_BR = CompressionEncoding.BROTLI.value
+_ENC_GZ = CompressionEncoding.GZIP.value
+_CLIENT_ENCODINGS = (
+    (lazy_fixture("brotli_client"), _ENC_BR),
+    (lazy_fixture("gzip_client"), _ENC_GZ),
+)
 
 
 @pytest.fixture()
 def handler() -> HTTPRouteHandler:
     @get(path="/", media_type=MediaType.TEXT)
     def handler_fn() -> str:
-        return "_litestar_" * 4000
+        return _PAYLOAD
 
     return handler_fn
 
 
-async def streaming_iter(content: bytes, count: int) -> AsyncIterator[bytes]:
-    for _ in range(count):
-        yield content
+async def streaming_iter(chunks: List[bytes]) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+def create_route_handlers() -> List[HTTPRouteHandler]:
+    @get(path="/", media_type=MediaType.TEXT)
+    def handler_fn() -> str:
+        return _PAYLOAD
+
+    @get("/streaming-response")
+    def streaming_handler() -> Stream:
+        return Stream(iterator=streaming_iter(_STREAM_CHUNKS), content_length=len(_PAYLOAD_BYTES))
+
+    @get(path="/no-compression", media_type=MediaType.TEXT)
+    def no_compress_handler() -> str:
+        return _SMALL_PAYLOAD
+
+    @get(path="/image", media_type="image/png")
+    def image_handler() -> bytes:
+        return _PAYLOAD_BYTES
+
+    return [handler_fn, streaming_handler, no_compress_handler, image_handler]
+
+
+@pytest.fixture(scope="module")
+def brotli_client() -> Iterator["TestClient[Litestar]"]:
+    with create_test_client(
+        route_handlers=create_route_handlers(), compression_config=CompressionConfig(backend="brotli")
+    ) as client:
+        yield client
+
+
+@pytest.fixture(scope="module")
+def gzip_client() -> Iterator["TestClient[Litestar]"]:
+    with create_test_client(
+        route_handlers=create_route_handlers(), compression_config=CompressionConfig(backend="gzip")
+    ) as client:
+        yield client
 
 
 def test_compression_disabled_for_unsupported_client(handler: HTTPRouteHandler) -> None:
     with create_test_client(route_handlers=[handler], compression_config=CompressionConfig(backend="brotli")) as client:
         response = client.get("/", headers={"accept-encoding": "deflate"})
         assert response.status_code == HTTP_200_OK
-        assert response.text == "_litestar_" * 4000
+        assert response.content == _PAYLOAD_BYTES
         assert "Content-Encoding" not in response.headers
         assert int(response.headers["Content-Length"]) == 40000
 
 
-@pytest.mark.parametrize(
-    "backend, compression_encoding", (("brotli", CompressionEncoding.BROTLI), ("gzip", CompressionEncoding.GZIP))
-)
-def test_regular_compressed_response(
-    backend: Literal["gzip", "brotli"], compression_encoding: CompressionEncoding, handler: HTTPRouteHandler
-) -> None:
-    with create_test_client(route_handlers=[handler], compression_config=CompressionConfig(backend="brotli")) as client:
-        response = client.get("/", headers={"Accept-Encoding": str(compression_encoding.value)})
-        assert response.status_code == HTTP_200_OK
-        assert response.text == "_litestar_" * 4000
-        assert response.headers["Content-Encoding"] == compression_encoding
-        assert int(response.headers["Content-Length"]) < 40000
+@pytest.mark.parametrize("client, encoding", _CLIENT_ENCODINGS)
+def test_regular_compressed_response(client: "TestClient[Litestar]", encoding: str) -> None:
+    response = client.get("/", headers={"Accept-Encoding": encoding})
+    assert response.status_code == HTTP_200_OK
+    assert response.content == _PAYLOAD_BYTES
+    assert response.headers["Content-Encoding"] == encoding
+    assert int(response.headers["Content-Length"]) < 40000
 
 
-@pytest.mark.parametrize(
-    "backend, compression_encoding", (("brotli", CompressionEncoding.BROTLI), ("gzip", CompressionEncoding.GZIP))
-)
-def test_compression_works_for_streaming_response(
-    backend: Literal["gzip", "brotli"], compression_encoding: CompressionEncoding
-) -> None:
-    @get("/streaming-response")
-    def streaming_handler() -> Stream:
-        return Stream(iterator=streaming_iter(content=b"_litestar_" * 400, count=10))
+@pytest.mark.parametrize("client, encoding", _CLIENT_ENCODINGS)
+def test_compression_works_for_streaming_response(client: "TestClient[Litestar]", encoding: str) -> None:
+    response = client.get("/streaming-response", headers={"Accept-Encoding": encoding})
+    assert response.status_code == HTTP_200_OK
+    assert response.content == _PAYLOAD_BYTES
+    assert response.headers["Content-Encoding"] == encoding
+    assert "Content-Length" not in response.headers
 
-    with create_test_client(
-        route_handlers=[streaming_handler], compression_config=CompressionConfig(backend=backend)
-    ) as client:
-        response = client.get("/streaming-response", headers={"Accept-Encoding": str(compression_encoding.value)})
-        assert response.status_code == HTTP_200_OK
-        assert response.text == "_litestar_" * 4000
-        assert response.headers["Content-Encoding"] == compression_encoding
-        assert "Content-Length" not in response.headers
+
+def test_streaming_response_content_length_without_compression(brotli_client: "TestClient[Litestar]") -> None:
+    response = brotli_client.get("/streaming-response", headers={"Accept-Encoding": "deflate"})
+    assert response.status_code == HTTP_200_OK
+    assert response.content == _PAYLOAD_BYTES
+    assert "Content-Encoding" not in response.headers
+    assert int(response.headers["Content-Length"]) == 40000
 
 
 @pytest.mark.parametrize(
-    "backend, compression_encoding", (("brotli", CompressionEncoding.BROTLI), ("gzip", CompressionEncoding.GZIP))
+    "content_length, expected_lgwin",
+    ((None, 22), (4000, 12), (4080, 12), (4081, 13), (4096, 13), (100, 10), (2**30, 22)),
 )
-def test_compression_skips_small_responses(
-    backend: Literal["gzip", "brotli"], compression_encoding: CompressionEncoding
+def test_brotli_window_fits_content_length(
+    content_length: Optional[int], expected_lgwin: int, mocker: MockerFixture
 ) -> None:
-    @get(path="/no-compression", media_type=MediaType.TEXT)
-    def no_compress_handler() -> str:
-        return "_litestar_"
+    compressor_mock = mocker.patch("brotli.Compressor")
+    CompressionFacade(
+        buffer=BytesIO(),
+        compression_encoding=CompressionEncoding.BROTLI,
+        config=CompressionConfig(backend="brotli"),
+        content_length=content_length,
+    )
+    assert compressor_mock.call_args.kwargs["lgwin"] == expected_lgwin
+
+
+@pytest.mark.parametrize("client, encoding", _CLIENT_ENCODINGS)
+def test_compression_skips_small_responses(client: "TestClient[Litestar]", encoding: str) -> None:
+    response = client.get("/no-compression", headers={"Accept-Encoding": encoding})
+    assert response.status_code == HTTP_200_OK
+    assert response.text == _SMALL_PAYLOAD
+    assert "Content-Encoding" not in response.headers
+    assert int(response.headers["Content-Length"]) == 10
+
+
+@pytest.mark.parametrize("client, encoding", _CLIENT_ENCODINGS)
+def test_compressor_not_created_for_small_responses(
+    client: "TestClient[Litestar]", encoding: str, mocker: MockerFixture
+) -> None:
+    facade_mock = mocker.patch("litestar.middleware.compression.CompressionFacade")
+    response = client.get("/no-compression", headers={"Accept-Encoding": encoding})
+    assert response.status_code == HTTP_200_OK
+    facade_mock.assert_not_called()
+
+
+@pytest.mark.parametrize("client, encoding", _CLIENT_ENCODINGS)
+def test_compression_skips_media_types(client: "TestClient[Litestar]", encoding: str, mocker: MockerFixture) -> None:
+    facade_mock = mocker.patch("litestar.middleware.compression.CompressionFacade")
+    response = client.get("/image", headers={"Accept-Encoding": encoding})
+    assert response.status_code == HTTP_200_OK
+    assert response.content == _PAYLOAD_BYTES
+    assert "Content-Encoding" not in response.headers
+    assert int(response.headers["Content-Length"]) == 40000
+    facade_mock.assert_not_called()
+
+
+def test_compression_of_media_type_enabled_by_config() -> None:
+    @get(path="/", media_type="image/png")
+    def handler_fn() -> bytes:
+        return _PAYLOAD_BYTES
 
     with create_test_client(
-        route_handlers=[no_compress_handler], compression_config=CompressionConfig(backend=backend)
+        route_handlers=[handler_fn], compression_config=CompressionConfig(backend="gzip", skip_media_types=frozenset())
     ) as client:
-        response = client.get("/no-compression", headers={"Accept-Encoding": str(compression_encoding.value)})
+        response = client.get("/", headers={"Accept-Encoding": _ENC_GZ})
         assert response.status_code == HTTP_200_OK
-        assert response.text == "_litestar_"
-        assert "Content-Encoding" not in response.headers
-        assert int(response.headers["Content-Length"]) == 10
+        assert response.content == _PAYLOAD_BYTES
+        assert response.headers["Content-Encoding"] == _ENC_GZ
 
 
 def test_brotli_with_gzip_fallback_enabled(handler: HTTPRouteHandler) -> None:
     with create_test_client(
         route_handlers=[handler], compression_config=CompressionConfig(backend="brotli", brotli_gzip_fallback=True)
     ) as client:
-        response = client.get("/", headers={"accept-encoding": CompressionEncoding.GZIP.value})
+        response = client.get("/", headers={"accept-encoding": _ENC_GZ})
         assert response.status_code == HTTP_200_OK
-        assert response.text == "_litestar_" * 4000
-        assert response.headers["Content-Encoding"] == CompressionEncoding.GZIP
+        assert response.content == _PAYLOAD_BYTES
+        assert response.headers["Content-Encoding"] == _ENC_GZ
         assert int(response.headers["Content-Length"]) < 40000
 
 
@@ -109,7 +194,7 @@ def test_brotli_gzip_fallback_disabled(handler: HTTPRouteHandler) -> None:
     ) as client:
         response = client.get("/", headers={"accept-encoding": "gzip"})
         assert response.status_code == HTTP_200_OK
-        assert response.text == "_litestar_" * 4000
+        assert response.content == _PAYLOAD_BYTES
         assert "Content-Encoding" not in response.headers
         assert int(response.headers["Content-Length"]) == 40000
 
@@ -126,41 +211,3 @@ async def test_skips_for_websocket() -> None:
         compression_config=CompressionConfig(backend="brotli", brotli_gzip_fallback=False),
     ).websocket_connect("/") as ws:
         assert b"content-encoding" not in dict(ws.scope["headers"])
-
-
-@pytest.mark.parametrize("minimum_size, should_raise", ((0, True), (1, False), (-1, True), (100, False)))
-def test_config_minimum_size_validation(minimum_size: int, should_raise: bool) -> None:
-    if should_raise:
-        with pytest.raises(ImproperlyConfiguredException):
-            CompressionConfig(backend="brotli", brotli_gzip_fallback=False, minimum_size=minimum_size)
-    else:
-        CompressionConfig(backend="brotli", brotli_gzip_fallback=False, minimum_size=minimum_size)
-
-
-@pytest.mark.parametrize(
-    "gzip_compress_level, should_raise", ((0, False), (1, False), (-1, True), (10, True), (9, False))
-)
-def test_config_gzip_compress_level_validation(gzip_compress_level: int, should_raise: bool) -> None:
-    if should_raise:
-        with pytest.raises(ImproperlyConfiguredException):
-            CompressionConfig(backend="brotli", brotli_gzip_fallback=False, gzip_compress_level=gzip_compress_level)
-    else:
-        CompressionConfig(backend="brotli", brotli_gzip_fallback=False, gzip_compress_level=gzip_compress_level)
-
-
-@pytest.mark.parametrize("brotli_quality, should_raise", ((0, False), (1, False), (-1, True), (12, True), (11, False)))
-def test_config_brotli_quality_validation(brotli_quality: int, should_raise: bool) -> None:
-    if should_raise:
-        with pytest.raises(ImproperlyConfiguredException):
-            CompressionConfig(backend="brotli", brotli_gzip_fallback=False, brotli_quality=brotli_quality)
-    else:
-        CompressionConfig(backend="brotli", brotli_gzip_fallback=False, brotli_quality=brotli_quality)
-
-
-@pytest.mark.parametrize("brotli_lgwin, should_raise", ((9, True), (10, False), (-1, True), (25, True), (24, False)))
-def test_config_brotli_lgwin_validation(brotli_lgwin: int, should_raise: bool) -> None:
-    if should_raise:
-        with pytest.raises(ImproperlyConfiguredException):
-            CompressionConfig(backend="brotli", brotli_gzip_fallback=False, brotli_lgwin=brotli_lgwin)
-    else:
-        CompressionConfig(backend="brotli", brotli_gzip_fallback=False, brotli_lgwin=brotli_lgwin)